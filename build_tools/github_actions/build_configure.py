@@ -40,11 +40,22 @@ platform_options = {
         "-DTHEROCK_BACKGROUND_BUILD_JOBS=4",
     ],
 }
+platform_cmake_options = platform_options.get(PLATFORM, [])
+
+# Splitting cmake options into an array (ex: "-flag X" -> ["-flag", "X"]) for subprocess.run
+extra_cmake_options_arr = extra_cmake_options.split() if extra_cmake_options else []
 
 
 def build_configure():
     logging.info(f"Building package {package_version}")
 
+    if PLATFORM == "windows":
+        # VCToolsInstallDir is required for build. Throwing an error if environment variable doesn't exist
+        if not vctools_install_dir:
+            raise Exception(
+                "Environment variable VCToolsInstallDir is not set. Please see https://github.com/ROCm/TheRock/blob/main/docs/development/windows_support.md#important-tool-settings about Windows tool configurations. Exiting."
+            )
+
     cmd = [
         "cmake",
         "-B",
@@ -57,22 +68,11 @@ def build_configure():
         "-DCMAKE_CXX_COMPILER_LAUNCHER=ccache",
         "-DTHEROCK_VERBOSE=ON",
         "-DBUILD_TESTING=ON",
+        # Adding platform specific options
+        *platform_cmake_options,
+        *extra_cmake_options_arr,
     ]
 
-    # Adding platform specific options
-    cmd += platform_options.get(PLATFORM, [])
-
-    if PLATFORM == "windows":
-        # VCToolsInstallDir is required for build. Throwing an error if environment variable doesn't exist
-        if not vctools_install_dir:
-            raise Exception(
-                "Environment variable VCToolsInstallDir is not set. Please see https://github.com/ROCm/TheRock/blob/main/docs/development/windows_support.md#important-tool-settings about Windows tool configurations. Exiting."
-            )
-
-    # Splitting cmake options into an array (ex: "-flag X" -> ["-flag", "X"]) for subprocess.run
-    cmake_options_arr = extra_cmake_options.split()
-    cmd += cmake_options_arr
-
     logging.info(shlex.join(cmd))
     subprocess.run(cmd, cwd=THEROCK_DIR, check=True)
 
@@ -41,6 +41,7 @@
 import fnmatch
 import json
 import os
+import re
 import subprocess
 import sys
 from typing import Iterable, List, Optional
@@ -53,6 +54,14 @@ from amdgpu_family_matrix import (
 
 from github_actions_utils import *
 
+# Lookup matrices for matrix_generator, merged once rather than on every call.
+amdgpu_family_info_matrix_all = (
+    amdgpu_family_info_matrix_presubmit | amdgpu_family_info_matrix_postsubmit
+)
+amdgpu_family_info_matrix_all_with_xfail = (
+    amdgpu_family_info_matrix_all | amdgpu_family_matrix_xfail
+)
+
 
 # --------------------------------------------------------------------------- #
 # Filtering by modified paths
@@ -62,20 +71,22 @@ from github_actions_utils import *
 def get_modified_paths(base_ref: str) -> Optional[Iterable[str]]:
     """Returns the paths of modified files relative to the base reference."""
     try:
-        return subprocess.run(
-            ["git", "diff", "--name-only", base_ref],
+        # NUL-separated output is not quoted or escaped by git, so paths with
+        # unusual characters come back verbatim instead of C-style quoted.
+        output = subprocess.run(
+            ["git", "diff", "--name-only", "-z", base_ref],
             stdout=subprocess.PIPE,
             check=True,
-            text=True,
             timeout=60,
-        ).stdout.splitlines()
-    except TimeoutError:
+        ).stdout
+    except subprocess.TimeoutExpired:
         print(
             "Computing modified files timed out. Not using PR diff to determine"
             " jobs to run.",
             file=sys.stderr,
         )
         return None
+    return [os.fsdecode(path) for path in output.split(b"\0") if path]
 
 
 # Paths matching any of these patterns are considered to have no influence over
@@ -103,19 +114,21 @@ SKIPPABLE_PATH_PATTERNS = [
     "experimental/*",
 ]
 
+# All skippable patterns combined into a single regex, so each path is checked
+# with one match instead of one fnmatch call per pattern.
+SKIPPABLE_PATH_REGEX = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in SKIPPABLE_PATH_PATTERNS)
+)
+
 
 def is_path_skippable(path: str) -> bool:
     """Determines if a given relative path to a file matches any skippable patterns."""
-    return any(fnmatch.fnmatch(path, pattern) for pattern in SKIPPABLE_PATH_PATTERNS)
-
+    return SKIPPABLE_PATH_REGEX.match(path) is not None
 
-def check_for_non_skippable_path(paths: Optional[Iterable[str]]) -> bool:
-    """Returns true if at least one path is not in the skippable set."""
-    if paths is None:
-        return False
-    return any(not is_path_skippable(p) for p in paths)
 
+GITHUB_WORKFLOWS_DIR = ".github/workflows/"
 
+# Patterns are relative to GITHUB_WORKFLOWS_DIR.
 GITHUB_WORKFLOWS_CI_PATTERNS = [
     "setup.yml",
     "ci*.yml",
@@ -124,18 +137,16 @@ GITHUB_WORKFLOWS_CI_PATTERNS = [
     "test*.yml",  # This may be too broad, but there are many test workflows.
 ]
 
-
-def is_path_workflow_file_related_to_ci(path: str) -> bool:
-    return any(
-        fnmatch.fnmatch(path, ".github/workflows/" + pattern)
-        for pattern in GITHUB_WORKFLOWS_CI_PATTERNS
-    )
+GITHUB_WORKFLOWS_CI_REGEX = re.compile(
+    "|".join(fnmatch.translate(pattern) for pattern in GITHUB_WORKFLOWS_CI_PATTERNS)
+)
 
 
-def check_for_workflow_file_related_to_ci(paths: Optional[Iterable[str]]) -> bool:
-    if paths is None:
+def is_path_workflow_file_related_to_ci(path: str) -> bool:
+    if not path.startswith(GITHUB_WORKFLOWS_DIR):
         return False
-    return any(is_path_workflow_file_related_to_ci(p) for p in paths)
+    workflow_path = path[len(GITHUB_WORKFLOWS_DIR) :]
+    return GITHUB_WORKFLOWS_CI_REGEX.match(workflow_path) is not None
 
 
 def should_ci_run_given_modified_paths(paths: Optional[Iterable[str]]) -> bool:
@@ -145,14 +156,18 @@ def should_ci_run_given_modified_paths(paths: Optional[Iterable[str]]) -> bool:
         print("No files were modified, skipping build jobs")
         return False
 
-    paths_set = set(paths)
-    github_workflows_paths = set(
-        [p for p in paths if p.startswith(".github/workflows")]
-    )
-    other_paths = paths_set - github_workflows_paths
-
-    related_to_ci = check_for_workflow_file_related_to_ci(github_workflows_paths)
-    contains_other_non_skippable_files = check_for_non_skippable_path(other_paths)
+    # Classify each path at most once, stopping as soon as both findings are
+    # known. Workflow files unrelated to CI are treated as skippable.
+    related_to_ci = False
+    contains_other_non_skippable_files = False
+    for p in paths:
+        if p.startswith(GITHUB_WORKFLOWS_DIR):
+            if not related_to_ci:
+                related_to_ci = is_path_workflow_file_related_to_ci(p)
+        elif not contains_other_non_skippable_files:
+            contains_other_non_skippable_files = not is_path_skippable(p)
+        if related_to_ci and contains_other_non_skippable_files:
+            break
 
     print("should_ci_run_given_modified_paths findings:")
     print(f"  related_to_ci: {related_to_ci}")
@@ -175,6 +190,9 @@ def should_ci_run_given_modified_paths(paths: Optional[Iterable[str]]) -> bool:
 # Matrix creation logic based on PR, push or workflow_dispatch
 # --------------------------------------------------------------------------- #
 
+# Runs of whitespace and/or punctuation separating families in user input.
+FAMILY_INPUT_SEPARATOR_REGEX = re.compile(rf"[\s{re.escape(string.punctuation)}]+")
+
 
 def get_pr_labels(args) -> List[str]:
     """Gets a list of labels applied to a pull request."""
@@ -186,16 +204,9 @@ def get_pr_labels(args) -> List[str]:
 
 
 def discover_targets(potential_targets, matrix):
-    # iterate through each potential target, validate it exists in our matrix and then append target to run on
-    targets = []
-
-    for target in potential_targets:
-        # For workflow dispatch triggers, this helps prevent potential user-input errors
-        target = target.lower()
-        if target in matrix:
-            targets.append(target)
-
-    return targets
+    # validate each potential target exists in our matrix and keep the ones to run on
+    # Lowercasing helps prevent potential user-input errors for workflow dispatch triggers
+    return [target for target in map(str.lower, potential_targets) if target in matrix]
 
 
 def matrix_generator(
@@ -209,63 +220,63 @@ def matrix_generator(
 ):
     """Parses and generates build matrix with build requirements"""
     targets = []
-    matrix = amdgpu_family_info_matrix_presubmit | amdgpu_family_info_matrix_postsubmit
+    matrix = amdgpu_family_info_matrix_all
 
     # For the specific event trigger, parse linux and windows target information
     # if the trigger is a workflow_dispatch, parse through the inputs and retrieve the list
     if is_workflow_dispatch:
-        print(f"[WORKFLOW_DISPATCH] Generating build matrix with {str(base_args)}")
+        print(f"[WORKFLOW_DISPATCH] Generating build matrix with {base_args}")
         # For workflow dispatch, user can select an "expect_failure" family or regular family
-        matrix = matrix | amdgpu_family_matrix_xfail
+        matrix = amdgpu_family_info_matrix_all_with_xfail
 
         input_gpu_targets = families.get("amdgpu_families")
 
-        # Sanitizing the string to remove any punctuation from the input
-        # After replacing punctuation with spaces, turning string input to an array
-        # (ex: ",gfx94X ,|.gfx1201" -> "gfx94X   gfx1201" -> ["gfx94X", "gfx1201"])
-        translator = str.maketrans(string.punctuation, " " * len(string.punctuation))
-        potential_targets = input_gpu_targets.translate(translator).split()
+        # Splitting the string input to an array on any punctuation and whitespace
+        # (ex: ",gfx94X ,|.gfx1201" -> ["gfx94X", "gfx1201"])
+        potential_targets = [
+            target
+            for target in FAMILY_INPUT_SEPARATOR_REGEX.split(input_gpu_targets)
+            if target
+        ]
         targets.extend(discover_targets(potential_targets, matrix))
 
     # if the trigger is a pull_request label, parse through the labels and retrieve the list
     if is_pull_request:
-        print(f"[PULL_REQUEST] Generating build matrix with {str(base_args)}")
+        print(f"[PULL_REQUEST] Generating build matrix with {base_args}")
         potential_targets = []
         pr_labels = get_pr_labels(base_args)
         for label in pr_labels:
-            if "gfx" in label:
-                target, _ = label.split("-")
+            if label.startswith("gfx"):
+                target, _, _ = label.partition("-")
                 potential_targets.append(target)
         targets.extend(discover_targets(potential_targets, matrix))
 
         # Add the presubmit targets
-        for target in amdgpu_family_info_matrix_presubmit:
-            targets.append(target)
+        targets.extend(amdgpu_family_info_matrix_presubmit)
 
     if is_push and base_args.get("branch_name") == "main":
-        print(f"[PUSH - MAIN] Generating build matrix with {str(base_args)}")
+        print(f"[PUSH - MAIN] Generating build matrix with {base_args}")
         # Add all options except for families that allow failures
-        for key in matrix:
-            targets.append(key)
+        targets.extend(matrix)
 
     if is_schedule:
-        print(f"[SCHEDULE] Generating build matrix with {str(base_args)}")
+        print(f"[SCHEDULE] Generating build matrix with {base_args}")
         # For schedule runs, we will run build and tests for only expect_failure families
-        matrix = matrix | amdgpu_family_matrix_xfail
+        matrix = amdgpu_family_info_matrix_all_with_xfail
 
         # Add all options that allow failures
-        for key in amdgpu_family_matrix_xfail:
-            targets.append(key)
+        targets.extend(amdgpu_family_matrix_xfail)
 
-    # Ensure the targets in the list are unique
-    unique_targets = list(set(targets))
+    # Ensure the targets in the list are unique, keeping a deterministic order
+    unique_targets = list(dict.fromkeys(targets))
 
     target_output = []
     for target in unique_targets:
-        if platform in matrix.get(target):
-            target_output.append(matrix.get(target).get(platform))
+        platform_info = matrix[target].get(platform)
+        if platform_info is not None:
+            target_output.append(platform_info)
 
-    print(f"Generated build matrix: {str(target_output)}")
+    print(f"Generated build matrix: {target_output}")
 
     return target_output
 
@@ -289,7 +300,7 @@ def main(base_args, linux_families, windows_families):
     print(f"  is_workflow_dispatch: {is_workflow_dispatch}")
     print(f"  is_pull_request: {is_pull_request}")
 
-    print(f"Generating build matrix for Linux: {str(linux_families)}")
+    print(f"Generating build matrix for Linux: {linux_families}")
     linux_target_output = matrix_generator(
         is_pull_request,
         is_workflow_dispatch,
@@ -300,7 +311,7 @@ def main(base_args, linux_families, windows_families):
         platform="linux",
     )
 
-    print(f"Generating test matrix for Windows: {str(windows_families)}")
+    print(f"Generating test matrix for Windows: {windows_families}")
     windows_target_output = matrix_generator(
         is_pull_request,
         is_workflow_dispatch,
@@ -316,12 +327,23 @@ def main(base_args, linux_families, windows_families):
         enable_build_jobs = True
     else:
         modified_paths = get_modified_paths(base_ref)
-        print("modified_paths (max 200):", modified_paths[:200])
+        if modified_paths is not None:
+            print("modified_paths (max 200):", modified_paths[:200])
         print(f"Checking modified files since this had a {github_event_name} trigger")
         # TODO(#199): other behavior changes
         #     * workflow_dispatch or workflow_call with inputs controlling enabled jobs?
         enable_build_jobs = should_ci_run_given_modified_paths(modified_paths)
 
+    # Serialize each output once and reuse it for the step summary. Compact
+    # separators keep the step outputs small.
+    output = {
+        "linux_amdgpu_families": json.dumps(linux_target_output, separators=(",", ":")),
+        "windows_amdgpu_families": json.dumps(
+            windows_target_output, separators=(",", ":")
+        ),
+        "enable_build_jobs": json.dumps(enable_build_jobs),
+    }
+
     gha_append_step_summary(
         f"""## Workflow configure results
 
@@ -329,15 +351,10 @@ def main(base_args, linux_families, windows_families):
 * `linux_use_prebuilt_artifacts`: {json.dumps(base_args.get("linux_use_prebuilt_artifacts"))}
 * `windows_amdgpu_families`: {str([item.get("family") for item in windows_target_output])}
 * `windows_use_prebuilt_artifacts`: {json.dumps(base_args.get("windows_use_prebuilt_artifacts"))}
-* `enable_build_jobs`: {json.dumps(enable_build_jobs)}
+* `enable_build_jobs`: {output["enable_build_jobs"]}
     """
     )
 
-    output = {
-        "linux_amdgpu_families": json.dumps(linux_target_output),
-        "windows_amdgpu_families": json.dumps(windows_target_output),
-        "enable_build_jobs": json.dumps(enable_build_jobs),
-    }
     gha_set_output(output)
 
 
@@ -55,7 +55,7 @@ def gha_set_env(vars: Mapping[str, str | Path]):
         return
 
     with open(env_file, "a") as f:
-        f.writelines(f"{k}={str(v)}" + "\n" for k, v in vars.items())
+        f.write("".join(f"{k}={str(v)}\n" for k, v in vars.items()))
 
 
 def gha_set_output(vars: Mapping[str, str | Path]):
@@ -75,7 +75,7 @@ def gha_set_output(vars: Mapping[str, str | Path]):
         return
 
     with open(step_output_file, "a") as f:
-        f.writelines(f"{k}={str(v)}" + "\n" for k, v in vars.items())
+        f.write("".join(f"{k}={str(v)}\n" for k, v in vars.items()))
 
 
 def gha_append_step_summary(summary: str):
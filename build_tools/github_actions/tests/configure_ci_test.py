@@ -1,7 +1,10 @@
+import fnmatch
 from pathlib import Path
 import os
+import subprocess
 import sys
 import unittest
+from unittest.mock import patch
 
 sys.path.insert(0, os.fspath(Path(__file__).parent.parent))
 import configure_ci
@@ -48,11 +51,55 @@ class ConfigureCITest(unittest.TestCase):
         run_ci = configure_ci.should_ci_run_given_modified_paths(paths)
         self.assertFalse(run_ci)
 
+    def test_path_patterns_match_fnmatch(self):
+        paths = [
+            "README.md",
+            "docs/development/README.md",
+            "docs/file.txt",
+            "external-builds/pytorch/CMakeLists.txt",
+            "experimental/file.h",
+            "LICENSE",
+            "third-party/LICENSE",
+            ".gitignore",
+            ".pre-commit-config.yaml",
+            "CMakeLists.txt",
+            "build_tools/fetch_sources.py",
+            ".github/workflows/ci.yml",
+            ".github/workflows/ci_linux.yml",
+            ".github/workflows/build_linux_packages.yml",
+            ".github/workflows/test_some_subproject.yml",
+            ".github/workflows/setup.yml",
+            ".github/workflows/pre-commit.yml",
+            ".github/dependabot.yml",
+        ]
+        for path in paths:
+            self.assertEqual(
+                configure_ci.is_path_skippable(path),
+                any(
+                    fnmatch.fnmatch(path, pattern)
+                    for pattern in configure_ci.SKIPPABLE_PATH_PATTERNS
+                ),
+                path,
+            )
+            self.assertEqual(
+                configure_ci.is_path_workflow_file_related_to_ci(path),
+                any(
+                    fnmatch.fnmatch(path, ".github/workflows/" + pattern)
+                    for pattern in configure_ci.GITHUB_WORKFLOWS_CI_PATTERNS
+                ),
+                path,
+            )
+
     def test_run_ci_if_source_file_and_unrelated_workflow_file_edited(self):
         paths = ["source_file.h", ".github/workflows/pre-commit.yml"]
         run_ci = configure_ci.should_ci_run_given_modified_paths(paths)
         self.assertTrue(run_ci)
 
+    @patch("subprocess.run")
+    def test_get_modified_paths_timeout(self, mock_run):
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="git", timeout=60)
+        self.assertIsNone(configure_ci.get_modified_paths("HEAD^"))
+
     def test_valid_linux_workflow_dispatch_matrix_generator(self):
         build_families = {"amdgpu_families": "   gfx94X , gfx103X"}
         linux_target_output = configure_ci.matrix_generator(
@@ -130,6 +177,22 @@ class ConfigureCITest(unittest.TestCase):
         self.assertGreaterEqual(len(windows_target_output), 1)
         self.assert_target_output_is_valid(windows_target_output)
 
+    def test_multi_dash_label_linux_pull_request_matrix_generator(self):
+        base_args = {"pr_labels": '{"labels":[{"name":"gfx950-linux-nightly"}]}'}
+        linux_target_output = configure_ci.matrix_generator(
+            is_pull_request=True,
+            is_workflow_dispatch=False,
+            is_push=False,
+            is_schedule=False,
+            base_args=base_args,
+            families={},
+            platform="linux",
+        )
+        self.assertTrue(
+            any("gfx950-dcgpu" == entry["family"] for entry in linux_target_output)
+        )
+        self.assert_target_output_is_valid(linux_target_output)
+
     def test_invalid_linux_pull_request_matrix_generator(self):
         base_args = {
             "pr_labels": '{"labels":[{"name":"gfx10000X-linux"},{"name":"gfx110000X-windows"}]}'
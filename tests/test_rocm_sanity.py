@@ -13,9 +13,11 @@ logger = logging.getLogger(__name__)
 
 THEROCK_BIN_DIR = Path(os.getenv("THEROCK_BIN_DIR")).resolve()
 
+PLATFORM = platform.system().lower()
+
 
 def is_windows():
-    return "windows" == platform.system().lower()
+    return "windows" == PLATFORM
 
 
 def run_command(command, cwd=None):